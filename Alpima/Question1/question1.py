@@ -1,153 +1,407 @@
-import numpy as np
-import pandas as pd
-
-def same_timeseries(ts1, ts2):
-    """
-    return True if timeseries ts1 == timeseries ts2.
-
-    :param ts1: pandas Series object
-    :param ts2: pandas Series object
-    
-    :return: True if ts1 and ts2 are at least identical (Allowed Difference - 0.00001).
-    """
-    
-    if len(ts1) == len(ts2):
-        # this will skip from the counting dates in which one (or both) ts are NaN
-        return np.nansum(ts1.values - ts2.values) < 10**-5
-    else:
-        return False
-
-    
-def find_differences(bbg_df, quandl_df, quandl_to_bbg_ticker_map, csv_file_path=None,
-                     equalOverCommonDateRange=False):
-    """
-    prints or saves to csv the differences between two timeseries files.
-
-    :param bbg_df: pandas Dataframe object
-    :param quandl_df: pandas Dataframe object
-    :param quandl_to_bbg_ticker_map: dictionary {key: Quandl ticker; value: BBG ticker}
-    :param csv_file_path: path to save the output csv file (default=None)
-        If csv_file_path is not None, will save the output to a csv file.
-    :param equalOverCommonDateRange: bool. If true, also a commonEndDate is considered 
-        and equality of the two time series is evaluated over the common date range [commonStartDate, commonEndDate]
-
-    :return: None.
-
-    for each ticker find the start date of data from both sources,
-    and prints True/False if prices series match since the common start date.
-
-    Compare (BBG 'price' to quandl 'close price')
-
-    CSV output example:
-    
-        Ticker, Quandl Start Date, BBG Start Date, Match since common start date?
-        DOC US Equity ,2000-01-01, 1990-01-01, True
-        ABO US Equity ,1999-01-01, 1990-01-01, False
-        ...
-        ...
-        ...
-        ABO US Equity ,1999-01-01, 1990-01-01, False
-    
-    """
-    
-    # write your code here.
-      
-    # set desired fields as columns of the result pd.DataFrame
-    columns = ['Ticker', 'Quandl Start Date', 'BBG Start Date', 
-               'Match since common start date?']
-    
-    # if the equality is checked over [commonStartDate, commonEndDate], 
-    # the two end dates are added as additional informations
-    if equalOverCommonDateRange:
-        tmp = columns.pop()
-        columns += ['Quandl End Date', 'BBG End Date', tmp]
-        
-    result = pd.DataFrame(columns=columns)
-    
-    # fill the Ticker column with Quandls tickers
-    result['Ticker'] = quandl_df.columns.levels[0] #quandl_to_bbg_ticker_map.keys()
-    
-    # convert string index to datetime index to ease the comparison
-    quandl_df.index = pd.to_datetime(quandl_df.index, format = '%Y-%m-%d')
-    bbg_df.index = pd.to_datetime(bbg_df.index, format = '%Y-%m-%d')
-    
-    # fill the other columns
-    for quandlTicker in result['Ticker']:
-        
-        # find Quandl start date
-        quandlStartDate = quandl_df[quandlTicker]['Close'].first_valid_index()
-        
-        # find BBG ticker and check whether BBG data are avialable
-        bbgTicker = quandl_to_bbg_ticker_map[quandlTicker]
-        
-        # if BBG provides data for the considered ticker, then check ts difference
-        if bbgTicker in bbg_df.columns.levels[0]:
-            
-            bbgStartDate = bbg_df[bbgTicker]['price'].first_valid_index() 
-            
-            # update result file
-            result.loc[result['Ticker'] == quandlTicker, ['Quandl Start Date', 'BBG Start Date']] = [quandlStartDate.strftime('%Y-%m-%d'), bbgStartDate.strftime('%Y-%m-%d')]
-           
-            # find commond start date
-            commonStartDate = max(quandlStartDate, bbgStartDate)
-            
-            # check equality of the two series between commonStartDate and commonEndDate
-            if equalOverCommonDateRange:
-                
-                # find Quandl and BBG end dates
-                quandlEndDate = quandl_df[quandlTicker]['Close'].last_valid_index()
-                bbgEndDate = bbg_df[bbgTicker]['price'].last_valid_index() 
-
-                # update result file
-                result.loc[result['Ticker'] == quandlTicker, ['Quandl End Date', 'BBG End Date']] = [quandlEndDate.strftime('%Y-%m-%d'), bbgEndDate.strftime('%Y-%m-%d')]
-
-                # find common start date
-                commonEndDate = min(quandlEndDate, bbgEndDate)
-                
-                # Quandl and BBG time series
-                tsQuandl = quandl_df[quandlTicker]['Close'][commonStartDate:commonEndDate]
-                tsBbg = bbg_df[bbgTicker]['price'][commonStartDate:commonEndDate]
-                
-                # align time series over the union of their indexes (filling with NaN when needed)
-                tsQuandl, tsBbg = tsQuandl.align(tsBbg)
-                                   
-            # check equality of the two series from the commonStartDate
-            else:
-                
-                tsQuandl = quandl_df[quandlTicker]['Close'][commonStartDate:]
-                tsBbg = bbg_df[bbgTicker]['price'][commonStartDate:]
-            
-            # check equality
-            result.loc[result['Ticker'] == quandlTicker, 'Match since common start date?'] = same_timeseries(tsQuandl, tsBbg) 
-        
-                
-        # if BBG doesn't provide any data for the considered ticker, then skip it.         
-        else:
-
-            result.loc[result['Ticker'] == quandlTicker, 
-                       ['Quandl Start Date', 'BBG Start Date', 'Match since common start date?']] = \
-                       [quandlStartDate.strftime('%Y-%m-%d'), "No data available for BBG ticker "+bbgTicker, "NA"]
-            
-    # save csv if file path was specified:
-    if csv_file_path:
-        result.to_csv(csv_file_path, index=False)
-    
-    else:
-        print(result)
-
-if __name__== "__main__":
-    
-    import csv 
-    
-    bbg_df = pd.read_csv("./bbg_data_final.csv", header=[0,1], index_col=0)
-    quandl_df = pd.read_csv("./quandl_data_final.csv", header=[0,1], index_col=0)
-    
-    # read the mapping table which maps each Quandls ticker into the corresponding bbg one
-    with open("./match_final.csv", 'r') as infile:
-        quandl_to_bbg_ticker = {rows[0]: rows[1] for rows in csv.reader(infile)} 
-        
-    # check equality of the two time-series from the common starting date
-    outputFile = "./output.csv" #"./output_commonDateRange.csv"        
-    find_differences(bbg_df, quandl_df, quandl_to_bbg_ticker, outputFile,
-                     equalOverCommonDateRange=False)
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+def same_timeseries(ts1, ts2):
+    """
+    return True if timeseries ts1 == timeseries ts2.
+
+    :param ts1: pandas Series object (or array-like)
+    :param ts2: pandas Series object (or array-like), aligned with ts1
+    
+    :return: True if ts1 and ts2 are at least identical (Allowed Difference - 0.00001).
+    """
+    
+    if len(ts1) == len(ts2):
+        
+        a = np.asarray(ts1, dtype=np.float64)
+        b = np.asarray(ts2, dtype=np.float64)
+        
+        # absolute differences, computed in-place on a single buffer
+        d = np.subtract(a, b)
+        np.abs(d, out=d)
+        
+        # this will skip from the check dates in which one (or both) ts are NaN
+        return bool(np.nanmax(d, initial=0.0) < 10**-5)
+    else:
+        return False
+
+    
+def compare_columns(values1, values2, first, last, columns):
+    """
+    return the result of same_timeseries for the given columns of two price matrices.
+
+    :param values1: numpy array of prices (rows: dates, columns: tickers)
+    :param values2: numpy array of prices, aligned with values1
+    :param first: numpy array with the first row of the comparison of each column
+    :param last: numpy array with the last (excluded) row of the comparison of each column
+    :param columns: positions of the columns to compare
+    
+    :return: list of bool, one per column.
+    """
+    
+    return [same_timeseries(values1[first[j]:last[j], j], values2[first[j]:last[j], j]) 
+            for j in columns]
+
+    
+def valid_date_range(df):
+    """
+    return the first and last valid (i.e. non-NaN) dates of each column of df.
+
+    :param df: pandas Dataframe object (index: dates, columns: tickers)
+    
+    :return: two pandas Series objects (index: tickers) with first and last valid dates
+        (NaT for columns without valid data).
+    """
+    
+    # a single pass over the NaN mask, for all the columns at once
+    # (float conversion needed for files without rows, which are read with object dtype)
+    valid = ~np.isnan(df.to_numpy(dtype=np.float64))
+    anyValid = valid.any(axis=0)
+    
+    if not anyValid.any():
+        noDates = pd.Series(pd.NaT, index=df.columns, dtype='datetime64[ns]')
+        return noDates, noDates.copy()
+    
+    first = valid.argmax(axis=0)
+    last = valid.shape[0] - 1 - valid[::-1].argmax(axis=0)
+    
+    # argmax is 0 for all-NaN columns: these have no valid dates
+    return (pd.Series(df.index[first], index=df.columns).where(anyValid),
+            pd.Series(df.index[last], index=df.columns).where(anyValid))
+
+    
+def report_differences(quandlTickers, bbgTickers, hasBbgData, quandlStartDate, bbgStartDate,
+                       quandlEndDate, bbgEndDate, match, csv_file_path=None, 
+                       equalOverCommonDateRange=False):
+    """
+    prints or saves to csv the result of the comparison of Quandl and BBG time series.
+
+    :param quandlTickers: pandas Index object of Quandl tickers
+    :param bbgTickers: pandas Series object of the BBG tickers (index: Quandl tickers)
+    :param hasBbgData: pandas Series object, True if BBG provides data for the ticker (index: Quandl tickers)
+    :param quandlStartDate, bbgStartDate: pandas Series objects of start dates (index: Quandl tickers)
+    :param quandlEndDate, bbgEndDate: pandas Series objects of end dates (index: Quandl tickers)
+    :param match: pandas Series object with the result of the comparison (index: Quandl tickers)
+    :param csv_file_path: path to save the output csv file (default=None)
+        If csv_file_path is not None, will save the output to a csv file.
+    :param equalOverCommonDateRange: bool. If true, the end dates are reported too.
+
+    :return: None.
+    """
+    
+    # set desired fields as columns of the result pd.DataFrame
+    columns = ['Ticker', 'Quandl Start Date', 'BBG Start Date', 
+               'Match since common start date?']
+    
+    # if the equality is checked over [commonStartDate, commonEndDate], 
+    # the two end dates are added as additional informations
+    if equalOverCommonDateRange:
+        tmp = columns.pop()
+        columns += ['Quandl End Date', 'BBG End Date', tmp]
+    
+    # columns of the result pd.DataFrame
+    data = {'Ticker': quandlTickers.to_series(),
+            'Quandl Start Date': quandlStartDate.dt.strftime('%Y-%m-%d'),
+            'BBG Start Date': bbgStartDate.dt.strftime('%Y-%m-%d').where(
+                hasBbgData, "No data available for BBG ticker " + bbgTickers),
+            'Quandl End Date': quandlEndDate.dt.strftime('%Y-%m-%d').where(hasBbgData),
+            'BBG End Date': bbgEndDate.dt.strftime('%Y-%m-%d'),
+            'Match since common start date?': match}
+    
+    # build the result pd.DataFrame at once
+    result = pd.DataFrame(data, columns=columns).reset_index(drop=True)
+            
+    # save csv if file path was specified:
+    if csv_file_path:
+        result.to_csv(csv_file_path, index=False)
+    
+    else:
+        print(result)
+
+    
+def find_differences(bbg_df, quandl_df, quandl_to_bbg_ticker_map, csv_file_path=None,
+                     equalOverCommonDateRange=False, n_jobs=None):
+    """
+    prints or saves to csv the differences between two timeseries files.
+
+    :param bbg_df: pandas Dataframe object
+    :param quandl_df: pandas Dataframe object
+    :param quandl_to_bbg_ticker_map: dictionary {key: Quandl ticker; value: BBG ticker}
+    :param csv_file_path: path to save the output csv file (default=None)
+        If csv_file_path is not None, will save the output to a csv file.
+    :param equalOverCommonDateRange: bool. If true, also a commonEndDate is considered 
+        and equality of the two time series is evaluated over the common date range [commonStartDate, commonEndDate]
+    :param n_jobs: number of threads comparing the time series (default=None: number of CPUs)
+
+    :return: None.
+
+    for each ticker find the start date of data from both sources,
+    and prints True/False if prices series match since the common start date.
+
+    Compare (BBG 'price' to quandl 'close price')
+
+    CSV output example:
+    
+        Ticker, Quandl Start Date, BBG Start Date, Match since common start date?
+        DOC US Equity ,2000-01-01, 1990-01-01, True
+        ABO US Equity ,1999-01-01, 1990-01-01, False
+        ...
+        ...
+        ...
+        ABO US Equity ,1999-01-01, 1990-01-01, False
+    
+    """
+    
+    # write your code here.
+    
+    # convert string index to datetime index to ease the comparison 
+    # (no-op if the index was already parsed, e.g. with read_csv(..., parse_dates=True))
+    quandl_df.index = pd.to_datetime(quandl_df.index)
+    bbg_df.index = pd.to_datetime(bbg_df.index)
+    
+    # reshape to 2D price matrices (rows: dates, columns: tickers)
+    quandlClose = quandl_df.xs('Close', level=1, axis=1)
+    bbgPrice = bbg_df.xs('price', level=1, axis=1)
+    
+    # Quandls tickers (index of the result) and the corresponding BBG tickers
+    quandlTickers = pd.Index(quandl_df.columns.levels[0], name='Ticker') #quandl_to_bbg_ticker_map.keys()
+    bbgTickers = quandlTickers.to_series().map(quandl_to_bbg_ticker_map)
+    
+    # tickers for which BBG provides data (set for O(1) membership check)
+    bbgTickersAvailable = set(bbgPrice.columns)
+    hasBbgData = bbgTickers.isin(bbgTickersAvailable)
+    
+    # find Quandl and BBG start and end dates (first and last non-NaN row of each column)
+    quandlStartDate, quandlEndDate = (d.reindex(quandlTickers) for d in valid_date_range(quandlClose))
+    bbgStartDate, bbgEndDate = (pd.Series(d.reindex(bbgTickers).values, index=quandlTickers).where(hasBbgData)
+                                for d in valid_date_range(bbgPrice))
+    
+    # find common start dates
+    commonStartDate = pd.concat([quandlStartDate, bbgStartDate], axis=1).max(axis=1, skipna=False)
+    
+    # find common end dates
+    commonEndDate = pd.concat([quandlEndDate, bbgEndDate], axis=1).min(axis=1, skipna=False)
+    
+    # reindex both price matrices once over the union of their dates (filling with NaN when needed), 
+    # with columns in the order of quandlTickers, so that the j-th columns are the two series to compare
+    masterIndex = quandlClose.index.union(bbgPrice.index)
+    quandlValues = quandlClose.reindex(index=masterIndex, columns=quandlTickers).values
+    bbgValues = bbgPrice.reindex(index=masterIndex, columns=bbgTickers.values).values
+    
+    masterDates = masterIndex.values.astype('datetime64[ns]')
+    commonStartDate = commonStartDate.values.astype('datetime64[ns]')
+    commonEndDate = commonEndDate.values.astype('datetime64[ns]')
+    
+    # first and last (excluded) row of the comparison for each ticker
+    first = np.searchsorted(masterDates, commonStartDate, side='left')
+    
+    if equalOverCommonDateRange:
+        
+        last = np.searchsorted(masterDates, commonEndDate, side='right')
+        sameLength = np.full(len(quandlTickers), True)
+        
+    else:
+        
+        # from the commonStartDate onwards, the two series must also have the same length in their own files
+        last = np.full(len(quandlTickers), len(masterDates))
+        sameLength = (len(quandlClose.index) - quandlClose.index.searchsorted(commonStartDate)) == \
+                     (len(bbgPrice.index) - bbgPrice.index.searchsorted(commonStartDate))
+    
+    # if BBG doesn't provide any data for the considered ticker, then the check is skipped
+    match = np.full(len(quandlTickers), "NA", dtype=object)
+    
+    # check equality of the two series between commonStartDate and commonEndDate (if any).
+    # Tickers are independent: they are split in one chunk per thread 
+    # (numpy releases the GIL in the comparison, and threads share the price matrices without copies)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    chunks = np.array_split(np.flatnonzero(hasBbgData.values), n_jobs)
+    
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        
+        results = executor.map(lambda columns: compare_columns(quandlValues, bbgValues, first, last, columns), 
+                               chunks)
+        
+        for columns, result in zip(chunks, results):
+            match[columns] = result
+    
+    # tickers without valid prices in one of the two sources (no common start date) don't match
+    hasCommonStartDate = ~np.isnat(commonStartDate)
+    
+    match = pd.Series(match, index=quandlTickers).where((sameLength & hasCommonStartDate) | ~hasBbgData.values, False)
+    
+    report_differences(quandlTickers, bbgTickers, hasBbgData, quandlStartDate, bbgStartDate,
+                       quandlEndDate, bbgEndDate, match, csv_file_path, equalOverCommonDateRange)
+
+
+def merge_sorted_chunks(chunks1, chunks2):
+    """
+    merges two streams of date-sorted chunks into a stream of pairs of chunks covering the same dates.
+
+    :param chunks1: iterable of pandas Dataframe objects (index: sorted dates)
+    :param chunks2: iterable of pandas Dataframe objects (index: sorted dates)
+    
+    :return: generator of (chunk1, chunk2) pairs. Rows of the two streams are yielded together 
+        up to a cut-off date known to both of them, the remaining ones are buffered.
+    """
+    
+    streams = [iter(chunks1), iter(chunks2)]
+    buffers = [next(stream, None) for stream in streams]
+    exhausted = [buffer is None for buffer in buffers]
+    
+    if all(exhausted):
+        return
+    
+    # an empty stream is merged as an empty chunk (no dates, no columns)
+    buffers = [buffers[1 - i].iloc[:0, :0] if done else buffers[i] for i, done in enumerate(exhausted)]
+    
+    while True:
+        
+        # refill empty buffers from their stream
+        for i in (0, 1):
+            while buffers[i].empty and not exhausted[i]:
+                chunk = next(streams[i], None)
+                if chunk is None:
+                    exhausted[i] = True
+                else:
+                    buffers[i] = chunk
+        
+        if buffers[0].empty and buffers[1].empty:
+            return
+        
+        # rows of a stream which is not exhausted may still follow its last buffered date
+        cutOffs = [buffer.index[-1] for buffer, done in zip(buffers, exhausted) if not done]
+        
+        if cutOffs:
+            cutOff = min(cutOffs)
+            chunks = [buffer[buffer.index <= cutOff] for buffer in buffers]
+            buffers = [buffer[buffer.index > cutOff] for buffer in buffers]
+        else:
+            chunks = buffers
+            buffers = [buffer.iloc[:0] for buffer in buffers]
+        
+        yield chunks[0], chunks[1]
+
+    
+def find_differences_from_csv(bbg_csv_path, quandl_csv_path, quandl_to_bbg_ticker_map, csv_file_path=None,
+                              equalOverCommonDateRange=False, chunksize=100000):
+    """
+    same as find_differences, but reading the two timeseries files by chunks of rows.
+
+    :param bbg_csv_path: path to the BBG csv file
+    :param quandl_csv_path: path to the Quandl csv file
+    :param quandl_to_bbg_ticker_map: dictionary {key: Quandl ticker; value: BBG ticker}
+    :param csv_file_path: path to save the output csv file (default=None)
+        If csv_file_path is not None, will save the output to a csv file.
+    :param equalOverCommonDateRange: bool. If true, also a commonEndDate is considered 
+        and equality of the two time series is evaluated over the common date range [commonStartDate, commonEndDate]
+    :param chunksize: number of rows read at once from each file (default=100000)
+
+    :return: None.
+
+    Only running per-ticker quantities (start/end dates, max absolute difference of the prices and 
+    number of dates since the common start date) are kept in memory, so that the memory footprint 
+    doesn't grow with the length of the price history.
+    Prices are compared date by date, over the dates provided by both sources.
+    """
+    
+    # read the headers only, to know the tickers in advance
+    quandlColumns = pd.read_csv(quandl_csv_path, header=[0,1], index_col=0, nrows=0).columns
+    bbgColumns = pd.read_csv(bbg_csv_path, header=[0,1], index_col=0, nrows=0).columns
+    
+    # Quandls tickers (index of the result) and the corresponding BBG tickers
+    quandlTickers = pd.Index(quandlColumns.levels[0], name='Ticker')
+    bbgTickers = quandlTickers.to_series().map(quandl_to_bbg_ticker_map)
+    
+    # tickers for which BBG provides data (set for O(1) membership check)
+    bbgTickersAvailable = set(bbgColumns[bbgColumns.get_level_values(1) == 'price'].get_level_values(0))
+    hasBbgData = bbgTickers.isin(bbgTickersAvailable)
+    
+    # streams of 2D price matrices (rows: dates, columns: tickers)
+    readOptions = dict(header=[0,1], index_col=0, parse_dates=True, chunksize=chunksize)
+    quandlChunks = (chunk.xs('Close', level=1, axis=1) for chunk in pd.read_csv(quandl_csv_path, **readOptions))
+    bbgChunks = (chunk.xs('price', level=1, axis=1) for chunk in pd.read_csv(bbg_csv_path, **readOptions))
+    
+    # running per-ticker start and end dates
+    quandlStartDate, quandlEndDate, bbgStartDate, bbgEndDate = \
+        (np.full(len(quandlTickers), np.datetime64('NaT'), dtype='datetime64[ns]') for _ in range(4))
+    
+    # running per-ticker max absolute difference of the prices
+    maxDiff = np.zeros(len(quandlTickers))
+    
+    # running per-ticker number of dates of each file since the common start date
+    quandlCount, bbgCount = np.zeros(len(quandlTickers), dtype=int), np.zeros(len(quandlTickers), dtype=int)
+    
+    for quandlChunk, bbgChunk in merge_sorted_chunks(quandlChunks, bbgChunks):
+        
+        # align the two chunks over the union of their dates, with columns in the order of quandlTickers
+        # (float conversion needed for empty chunks, which are read with object dtype)
+        dates = quandlChunk.index.union(bbgChunk.index)
+        quandlValues = quandlChunk.reindex(index=dates, columns=quandlTickers).to_numpy(dtype=np.float64)
+        bbgValues = bbgChunk.reindex(index=dates, columns=bbgTickers.values).to_numpy(dtype=np.float64)
+        
+        dates = dates.values.astype('datetime64[ns]')
+        
+        # update start and end dates with the first and last valid rows of the chunk
+        for values, startDate, endDate in ((quandlValues, quandlStartDate, quandlEndDate), 
+                                           (bbgValues, bbgStartDate, bbgEndDate)):
+            
+            valid = ~np.isnan(values)
+            anyValid = valid.any(axis=0)
+            
+            first = dates[valid.argmax(axis=0)]
+            last = dates[valid.shape[0] - 1 - valid[::-1].argmax(axis=0)]
+            
+            startDate[:] = np.where(np.isnat(startDate) & anyValid, first, startDate)
+            endDate[:] = np.where(anyValid, last, endDate)
+        
+        # start dates are final once found and chunks come in date order, so the common start date 
+        # of a ticker is known by the chunk containing it and no previous date follows it (NaT: not yet known)
+        commonStartDate = np.maximum(quandlStartDate, bbgStartDate)
+        
+        for chunk, count in ((quandlChunk, quandlCount), (bbgChunk, bbgCount)):
+            
+            chunkDates = chunk.index.values.astype('datetime64[ns]')
+            count += len(chunkDates) - np.searchsorted(chunkDates, commonStartDate)
+        
+        # update max absolute difference (dates in which one or both prices are NaN are skipped)
+        np.fmax(maxDiff, np.nanmax(np.abs(quandlValues - bbgValues), axis=0, initial=0.0), out=maxDiff)
+    
+    # out of the common date range one of the two series is NaN, 
+    # so the max difference is already restricted to it.
+    # Tickers without valid prices in one of the two sources (no common start date) don't match
+    match = (maxDiff < 10**-5) & ~np.isnat(np.maximum(quandlStartDate, bbgStartDate))
+    
+    # check equality of the two series from the commonStartDate: 
+    # as in same_timeseries, these must also have the same length
+    if not equalOverCommonDateRange:
+        
+        match &= quandlCount == bbgCount
+    
+    # if BBG doesn't provide any data for the considered ticker, then the check is skipped
+    match = pd.Series(match, index=quandlTickers, dtype=object).where(hasBbgData, "NA")
+    
+    # back to pandas Series indexed by Quandl tickers
+    quandlStartDate, quandlEndDate = (pd.Series(d, index=quandlTickers) for d in (quandlStartDate, quandlEndDate))
+    bbgStartDate, bbgEndDate = (pd.Series(d, index=quandlTickers).where(hasBbgData) for d in (bbgStartDate, bbgEndDate))
+    
+    report_differences(quandlTickers, bbgTickers, hasBbgData, quandlStartDate, bbgStartDate,
+                       quandlEndDate, bbgEndDate, match, csv_file_path, equalOverCommonDateRange)
+
+
+if __name__== "__main__":
+    
+    import csv 
+    
+    # read the mapping table which maps each Quandls ticker into the corresponding bbg one
+    with open("./match_final.csv", 'r') as infile:
+        quandl_to_bbg_ticker = {rows[0]: rows[1] for rows in csv.reader(infile)} 
+        
+    # check equality of the two time-series from the common starting date
+    outputFile = "./output.csv" #"./output_commonDateRange.csv"        
+    # (time series files are read by chunks of rows, see find_differences_from_csv)
+    find_differences_from_csv("./bbg_data_final.csv", "./quandl_data_final.csv", quandl_to_bbg_ticker, 
+                              outputFile, equalOverCommonDateRange=False)
     
\ No newline at end of file
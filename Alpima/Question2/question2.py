@@ -1,84 +1,125 @@
-#import sys
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
- 
-
-def plot_dr_ratio(portfolio_index, dr, figure_file_path=None):
-    """
-	:param portfolio_index: pandas Dataframe object of the portfolio index
-	:param dr: pandas Dataframe object of the DR ratio
-    :param figure_file_path: path to the figure file (default=None). 
-                             If None, the figure is printed on screen.
-
-    
-    :return: None.
-	"""
-	
-    fig, ax1 = plt.subplots(figsize=(9,6))
-    
-    idx = portfolio_index.index
-
-    ax1.plot(idx, dr.values, 'b-')
-    ax1.set_xlabel('Date')
-    
-    # Make the y-axis label, ticks and tick labels match the line color.
-    ax1.set_ylabel('Diversification Ratio', color='b')
-    ax1.tick_params('y', colors='b')
-    
-    ax2 = ax1.twinx()
-    ax2.plot(idx, portfolio_index.values, 'r-')
-    ax2.set_ylabel('Portfolio Index', color='r')
-    ax2.tick_params('y', colors='r')
-    
-    fig.tight_layout()
-    
-    if figure_file_path:
-        fig.savefig(figure_file_path, dpi=fig.dpi)
-    else:
-        plt.show()
-
-def rolling_dr_ratio(df, rolling_window_size=200, figure_file_path=None):
-    """
-	calculates and plots the dr ratio.
-	
-    :param df: the dataframe contains the daily total return price change, the weights and the portfolio index.
-    :param rolling_window_size: default to 200 days.
-    :param figure_file_path: path to the figure file (default=None). 
-                             If None, the figure is only printed on screen.
-    
-    :return: None.
-    """
-    
-    # compute rolling asset std-dev
-    rollingStdDev = df['TR_Change'][:].rolling(rolling_window_size).std()
-    
-    df = df.join(pd.DataFrame(rollingStdDev.values, 
-                              columns=pd.MultiIndex.from_product([['Rolling_StdDev'],['Asset_1', 'Asset_2', 'Asset_3', 'Asset_4']]), 
-                              index=df.index))
-
-    # compute rolling asset covariance matrix
-    rollingCov = df['TR_Change'][:].rolling(rolling_window_size).cov()
-
-    # compute rolling weighted average of asset std-dev
-    df['Rolling_StdDev','weightedAverage'] = [np.dot(df.loc[t,'Weight'].values, 
-                                                     df.loc[t,'Rolling_StdDev'].values)
-                                              for t in df.index]
-    # compute rolling portfolio std-dev
-    df['Rolling_StdDev','Portfolio'] = [np.sqrt(np.dot(df.loc[t,'Weight'].values, 
-                                                       np.dot(rollingCov.loc[t,:].values, df.loc[t,'Weight'].values))) 
-                                        for t in df.index]
-
-
-    # calculate the rolling DR ratio (source: http://www.tobam.fr/wp-content/uploads/2014/12/TOBAM-JoPM-Maximum-Div-2008.pdf)
-    dr = df['Rolling_StdDev','weightedAverage'] / df['Rolling_StdDev','Portfolio']
-
-    # plot index and the rolling dr
-    plot_dr_ratio(df["Portfolio_Index"], dr, figure_file_path)
-
-
-if __name__ == "__main__":
-    
-    df = pd.read_csv("./dr.csv", header=[0,1], index_col=0, parse_dates=True)
-    
+#import sys
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import pandas as pd
+import matplotlib.pyplot as plt
+ 
+
+def plot_dr_ratio(portfolio_index, dr, figure_file_path=None):
+    """
+	:param portfolio_index: pandas Dataframe object of the portfolio index
+	:param dr: pandas Dataframe object of the DR ratio
+    :param figure_file_path: path to the figure file (default=None). 
+                             If None, the figure is printed on screen.
+
+    
+    :return: None.
+	"""
+	
+    fig, ax1 = plt.subplots(figsize=(9,6))
+    
+    idx = portfolio_index.index
+
+    ax1.plot(idx, dr.values, 'b-')
+    ax1.set_xlabel('Date')
+    
+    # Make the y-axis label, ticks and tick labels match the line color.
+    ax1.set_ylabel('Diversification Ratio', color='b')
+    ax1.tick_params('y', colors='b')
+    
+    ax2 = ax1.twinx()
+    ax2.plot(idx, portfolio_index.values, 'r-')
+    ax2.set_ylabel('Portfolio Index', color='r')
+    ax2.tick_params('y', colors='r')
+    
+    fig.tight_layout()
+    
+    if figure_file_path:
+        fig.savefig(figure_file_path, dpi=fig.dpi)
+    else:
+        plt.show()
+
+def rolling_covariance(X, rolling_window_size):
+    """
+    calculates the rolling (sample) covariance matrix of the columns of X, for all the 
+    dates at once, over windows which are strided views of X.
+    
+    The windows are never de-meaned (which would copy them, W times the size of X): 
+    the covariance is the windowed product of the observations minus the outer product 
+    of the window means, so that the memory footprint is that of the output (plus a shifted copy of X).
+    
+    :param X: numpy float array of shape (dates x assets)
+    :param rolling_window_size: rolling window size.
+    
+    :return: numpy array of shape (dates x assets x assets), of the same dtype of X. The matrices of the first
+             rolling_window_size-1 dates, as well as those of windows with missing 
+             observations, are NaN.
+    """
+    
+    T, N = X.shape
+    
+    rollingCov = np.full((T, N, N), np.nan, dtype=X.dtype)
+    
+    if rolling_window_size > T:
+        return rollingCov
+    
+    # observations shifted by their full-sample mean (covariances are shift invariant),
+    # to limit the cancellation in the difference below
+    shifted = X - np.nanmean(X, axis=0)
+    
+    # windows ending on each date from the (rolling_window_size-1)-th: (dates x assets x window)
+    windows = sliding_window_view(shifted, rolling_window_size, axis=0)
+    
+    # window means (dates x assets)
+    means = windows.mean(axis=-1)
+    
+    # batched matrix product over the window dimension, minus the outer product of the means, 
+    # with Bessel's correction
+    rollingCov[rolling_window_size - 1:] = (windows @ windows.swapaxes(1, 2) - 
+                                            rolling_window_size * means[:, :, None] * means[:, None, :]) / (rolling_window_size - 1)
+    
+    return rollingCov
+
+def rolling_dr_ratio(df, rolling_window_size=200, figure_file_path=None, dtype=np.float32):
+    """
+	calculates and plots the dr ratio.
+	
+    :param df: the dataframe contains the daily total return price change, the weights and the portfolio index.
+    :param rolling_window_size: default to 200 days.
+    :param figure_file_path: path to the figure file (default=None). 
+                             If None, the figure is only printed on screen.
+    :param dtype: float type of returns, weights and covariances (default=np.float32).
+                  The DR ratio is a plotting-quality statistic: single precision halves 
+                  the memory traffic of the (dates x assets x assets) covariance tensor. 
+                  Square roots and the final ratio are always computed in double precision.
+    
+    :return: None.
+    """
+    
+    # compute rolling asset covariance matrix (dates x assets x assets)
+    rollingCov = rolling_covariance(df['TR_Change'].to_numpy(dtype=dtype), rolling_window_size)
+    
+    # compute rolling asset std-dev (dates x assets)
+    rollingStdDev = np.sqrt(np.diagonal(rollingCov, axis1=1, axis2=2).astype(np.float64))
+    
+    # asset weights (dates x assets)
+    weights = df['Weight'].to_numpy(dtype=dtype)
+
+    # compute rolling weighted average of asset std-dev
+    weightedAverage = (weights * rollingStdDev).sum(axis=1)
+    
+    # compute rolling portfolio std-dev
+    portfolioStdDev = np.sqrt(np.einsum('ti,tij,tj->t', weights, rollingCov, weights).astype(np.float64))
+
+    # calculate the rolling DR ratio (source: http://www.tobam.fr/wp-content/uploads/2014/12/TOBAM-JoPM-Maximum-Div-2008.pdf)
+    dr = pd.Series(weightedAverage / portfolioStdDev, index=df.index)
+
+    # plot index and the rolling dr
+    plot_dr_ratio(df["Portfolio_Index"], dr, figure_file_path)
+
+
+if __name__ == "__main__":
+    
+    df = pd.read_csv("./dr.csv", header=[0,1], index_col=0, parse_dates=True)
+    
     rolling_dr_ratio(df, figure_file_path="./DR_with_PortfolioIndex.png")
\ No newline at end of file
@@ -1,4 +1,3 @@
-import pandas as pd
 import numpy as np
 
 if __name__ == "__main__":
@@ -6,19 +5,17 @@ if __name__ == "__main__":
     import h5py
     import matplotlib.pylab as plt
     
-    #x = pd.read_hdf("./X.h5")    
-    #y = pd.read_hdf("./Y.h5")
-    
     # import dataset
     x = h5py.File('./X.h5','r')
     y = h5py.File('./Y.h5','r')
     
-    # convert to pandas DataFrame
-    df_x = pd.DataFrame(x['X'][:])
-    df_y = pd.DataFrame(y['Y'][:])
+    # read datasets as plain numpy arrays (no pandas DataFrame wrapping needed).
+    # For lazy, chunked access, the dataset handles x['X'] and y['Y'] can be sliced directly instead.
+    arr_x = x['X'][...]
+    arr_y = y['Y'][...]
     
-    # rename columns for readability
-    df_x.columns = ['x'+str(i+1) for i in df_x.columns]
-    df_y.columns = ['y'+str(i+1) for i in df_y.columns]
+    # column names for readability
+    col_x = ['x'+str(i+1) for i in range(arr_x.shape[1])]
+    col_y = ['y'+str(i+1) for i in range(arr_y.shape[1])]
     
     print(1)
\ No newline at end of file
@@ -1,5 +1,62 @@
+import math
 import numpy as np
-from scipy.stats import norm
+from numba import njit, vectorize
+
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi) # standard normal PDF normalization
+INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+# Closed-form pricing kernels. The @vectorize ones are compiled by numba into numpy ufuncs, 
+# which evaluate the whole formula in a single compiled loop, either on scalars or on 
+# (broadcasted) arrays of options. 
+
+@njit(cache=True)
+def normCdf(x):
+    return 0.5 * math.erfc(-x * INV_SQRT_2)
+
+@njit(cache=True)
+def normPdf(x):
+    return math.exp(-0.5 * x * x) * INV_SQRT_2PI
+
+@vectorize(["float64(float64, float64, float64, float64)"], cache=True)
+def blackCallPrice(discountedForward, discountedStrike, logMoneyness, stdDev):
+    """
+    Black call price D * (F * N(d1) - K * N(d2)) as a function of the discounted forward D * F, 
+    the discounted strike D * K, the log-moneyness log(F / K) and the std-dev sigma * sqrt(tau).
+    """
+    
+    d1 = logMoneyness / stdDev + 0.5 * stdDev
+    d2 = d1 - stdDev
+    
+    return discountedForward * normCdf(d1) - discountedStrike * normCdf(d2)
+
+@vectorize(["float64(float64, float64, float64)"], cache=True)
+def blackVega(discountedForward, logMoneyness, stdDev):
+    """
+    Derivative of blackCallPrice w.r.t. the std-dev: D * F * pdf(d1).
+    """
+    
+    d1 = logMoneyness / stdDev + 0.5 * stdDev
+    
+    return discountedForward * normPdf(d1)
+
+@vectorize(["float64(float64, float64)"], cache=True)
+def bachelierCallPrice(moneyness, stdDev):
+    """
+    Bachelier call price y * N(d) + s * pdf(d), d = y / s, as a function of the moneyness y 
+    and of the std-dev s.
+    """
+    
+    d = moneyness / stdDev
+    
+    return moneyness * normCdf(d) + stdDev * normPdf(d)
+
+@vectorize(["float64(float64, float64)"], cache=True)
+def bachelierVega(moneyness, stdDev):
+    """
+    Derivative of bachelierCallPrice w.r.t. the std-dev: pdf(d).
+    """
+    
+    return normPdf(moneyness / stdDev)
 
 class RootFinder(object):
     
@@ -15,106 +72,206 @@ class RootFinder(object):
     def setRootFindMethod(self, rootFinderName = "dekkers"):
         
         rootFindersAvailable = {"dekkers": self.__dekkersMethod,
-                                "bisection": self.__bisectionMethod}
+                                "bisection": self.__bisectionMethod,
+                                "newton": self.__newtonMethod}
         
         if rootFinderName in rootFindersAvailable:        
             self.__rootFindMethod = rootFindersAvailable[rootFinderName]
         else:
             raise NameError("root finder method not available")
 
-    def __bisectionMethod(self, f, a=0, b=100):
+    def __bracket(self, f, a, b):
+        """
+        Evaluates f at the bounds a and b, broadcasting them to the shape of f's output.
+        
+        Returns a, f(a), b, f(b) as float arrays and the mask of the roots which are
+        not bracketed by [a, b] (case in which f saturates and doesn't change sign, 
+        or is not defined at the bounds).
+        
+        Comments: where f(a) is not defined (e.g. 0/0 at-the-money prices at zero volatility),
+                  the lower bound is moved inside the interval by the tolerance.
+        """
+        
+        fa = f(a)
+        fb = f(b)
+        
+        shape = np.shape(fa * fb)
+        a = np.full(shape, a, dtype=float)
+        b = np.full(shape, b, dtype=float)
+        fa = np.full(shape, fa, dtype=float)
+        fb = np.full(shape, fb, dtype=float)
+        
+        undefined = ~np.isfinite(fa)
+        if undefined.any():
+            a = np.where(undefined, a + self.accuracy, a)
+            fa = np.where(undefined, f(a), fa)
+        
+        return a, fa, b, fb, ~(fa * fb <= 0)
+
+    def __bisectionMethod(self, f, a=0, b=100, fprime=None):
         '''
         Simple implementation of bisection method f(c) == 0.
         
+        Works element-wise: if f maps an array of guesses to an array of values 
+        (one independent root per element), all the roots are found at once.
+        
         args:
             f: the function whose root c: f(c) == 0 has to be found
             a: initial guess for the lower bound of the root  (default: 0)
             b: initial guess for the upper bound of the root (default: 1)
             (An exception will be raised for invalid guesses of a and b)
+            fprime: derivative of f (not used, the method is derivative free)
             accuracy: desired tolerance
             
         output:
-            approximate root c
+            approximate root c (NaN where f doesn't change sign in [a, b])
         '''
 
-        if f(a) * f(b) > 0:
-            return np.nan # case in which f saturates and doesn't change sign
+        a, fa, b, fb, notBracketed = self.__bracket(f, a, b)
+        
+        c = np.full(a.shape, np.nan)
+        
+        # roots still to be refined
+        active = ~notBracketed & (np.abs(b - a) > self.accuracy)
+            
+        while active.any():
+            
+            c = np.where(active, 0.5*(a + b), c)
+            fc = f(c)
             
-        while abs(b - a) > self.accuracy:
+            # exact roots: collapse the bracket on c
+            found = active & (fc == 0)
             
-            c = 0.5*(a + b)
+            left = active & ~found & (fa * fc > 0)
+            right = active & ~found & ~left
             
-            if f(c) == 0:
-                return c
+            a = np.where(left | found, c, a)
+            fa = np.where(left, fc, fa)
+            b = np.where(right | found, c, b)
             
-            elif f(a) * f(c) > 0:
-                a = c
-            else:
-                b = c
-        return c
+            active = active & ~found & (np.abs(b - a) > self.accuracy)
+            
+        return np.where(notBracketed, np.nan, c)[()]
     
-    def __dekkersMethod(self, f, a=0, b=100):
+    def __dekkersMethod(self, f, a=0, b=100, fprime=None):
         '''
         Implementation of the Dekker's method (also derivative free) for f(c) == 0.
         Code adapted from: https://share.cocalc.com/share/ab93d447b6728ae561bf1f9e18f0b103316d715f/Efficiency%20of%20Standard%20and%20Hybrid%20Root%20Finding%20Methods.sagews?viewer=share
     
+        Works element-wise: if f maps an array of guesses to an array of values 
+        (one independent root per element), all the roots are found at once.
+        Converged elements are frozen while the others keep iterating.
+        
         args:
             f: the function whose root c: f(c) == 0 has to be found
             a: initial guess for the lower bound of the root (default: 0)
             b: initial guess for the upper bound of the root (default: 1)
+            fprime: derivative of f (not used, the method is derivative free)
             
         output:
-            approximate root c
+            approximate root c (NaN where f doesn't change sign in [a, b])
         '''
         
-        if f(a) * f(b) > 0:
-            return np.nan # case in which f saturates and doesn't change sign
-            
-        fa = f(a)
-        fb = f(b)
+        a, fa, b, fb, notBracketed = self.__bracket(f, a, b)
         
         # initialize our c to be a and f(a)
         c = a
         fc = fa
         
-        while abs(b-a) > self.accuracy:
+        # roots still to be refined
+        active = ~notBracketed & (np.abs(b - a) > self.accuracy)
+        
+        while active.any():
             
             # Perform swaps to have properly inverted signs
-            if fb*fc > 0:
-                c = a
-                fc = fa
+            swap = active & (fb*fc > 0)
+            c = np.where(swap, a, c)
+            fc = np.where(swap, fa, fc)
                 
-            if abs(fc) < abs(fb):
-                a = b
-                fa = fb
-                b = c
-                fb = fc
-                c = a
-                fc = fa
+            swap = active & (np.abs(fc) < np.abs(fb))
+            a, b, c = np.where(swap, b, a), np.where(swap, c, b), np.where(swap, b, c)
+            fa, fb, fc = np.where(swap, fb, fa), np.where(swap, fc, fb), np.where(swap, fb, fc)
             
             # bisection
             m = 0.5*(b+c)
             
             p = (b-a)*fb
-            if p >= 0:
-                q = fa - fb
-            else:
-                q = fb - fa
-                p = -p
-            a = b
-            fa = fb
-            if p <= (m - b)*q:
-                b = b + p/q
-                fb = f(b)
-            else:            
-                b = m
-                fb = f(b)
-
-        return b
+            q = np.where(p >= 0, fa - fb, fb - fa)
+            p = np.abs(p)
+            
+            a = np.where(active, b, a)
+            fa = np.where(active, fb, fa)
+            
+            # secant step if it falls within the bracket, bisection otherwise
+            with np.errstate(divide='ignore', invalid='ignore'):
+                b = np.where(active, np.where(p <= (m - b)*q, b + p/q, m), b)
+            
+            fb = np.where(active, f(b), fb)
+            
+            active = active & (np.abs(b - a) > self.accuracy)
+
+        return np.where(notBracketed, np.nan, b)[()]
+
+    def __newtonMethod(self, f, a=0, b=100, fprime=None):
+        '''
+        Implementation of the Newton's method for f(c) == 0, safeguarded by bisection:
+        the bracket [a, b] is shrunk at each iteration and, whenever the Newton step 
+        falls outside of it, a bisection step is taken instead.
+        
+        Works element-wise: if f maps an array of guesses to an array of values 
+        (one independent root per element), all the roots are found at once.
+        
+        args:
+            f: the function whose root c: f(c) == 0 has to be found
+            a: initial guess for the lower bound of the root (default: 0)
+            b: initial guess for the upper bound of the root (default: 1)
+            fprime: derivative of f
+            
+        output:
+            approximate root c (NaN where f doesn't change sign in [a, b])
+        '''
+        
+        if fprime is None:
+            raise NameError("Newton's method needs the derivative of the function")
+        
+        a, fa, b, fb, notBracketed = self.__bracket(f, a, b)
+        
+        # start from the middle of the bracket
+        c = 0.5*(a + b)
+        
+        # roots still to be refined
+        active = ~notBracketed & (np.abs(b - a) > self.accuracy)
+        
+        while active.any():
+            
+            fc = f(c)
+            
+            # shrink the bracket, keeping the root inside
+            left = fa * fc > 0
+            a = np.where(active & left, c, a)
+            fa = np.where(active & left, fc, fa)
+            b = np.where(active & ~left, c, b)
+            
+            # Newton step if it falls within the bracket, bisection otherwise
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cNew = c - fc / fprime(c)
+            cNew = np.where((cNew > a) & (cNew < b), cNew, 0.5*(a + b))
+            
+            converged = (fc == 0) | (np.abs(cNew - c) <= self.accuracy) | (np.abs(b - a) <= self.accuracy)
+            
+            c = np.where(active & (fc != 0), cNew, c)
+            
+            active = active & ~converged
+
+        return np.where(notBracketed, np.nan, c)[()]
 
     
 class Option(object):
 
+    # fixed attribute layout: no per-instance __dict__
+    __slots__ = ("V_mkt", "X", "K", "tau", "r", "OptionType", "ModelType", "PutCallParityOffset",
+                 "_sqrtTau", "_discount", "_logXK", "_pricer", "_vega")
+
     def __init__(self, V_mkt, X, K, tau, r, OptionType, 
                  ModelType):
 
@@ -124,23 +281,21 @@ class Option(object):
         self.tau = tau / 365.0 # time to maturity (yearly units, ACT/365)
         self.r = r # risk-free rate
         
-        self.__OptionType = OptionType # either "Call" or "Put"
-        self.__ModelType = ModelType # either "BlackScholes" or "Bachelier"
+        self.OptionType = OptionType # either "Call" or "Put"
+        self.ModelType = ModelType # either "BlackScholes" or "Bachelier"
         
-        self.__PutCallParityOffset = None # price offset w.r.t. call price 
+        self.PutCallParityOffset = None # price offset w.r.t. call price 
+        
+        # tau and r are fixed per option: cache the terms of the pricing formulas
+        # which don't depend on the volatility, as these are evaluated many times by the root finder
+        self._sqrtTau = np.sqrt(self.tau) # square root of time to maturity
+        self._discount = np.exp(-self.r * self.tau) # discount factor
+        self._logXK = np.log(self.X / self.K) # log-moneyness
+        
+        # pricing and vega methods are selected once, instead of at each root finder iteration
+        self._pricer = self.getOptionPrice()
+        self._vega = self.getOptionVega()
         
-    def getOptionType(self):
-        return self.__OptionType
-
-    def getModelType(self):
-        return self.__ModelType
-    
-    def getPutCallParityOffset(self):
-        return self.__PutCallParityOffset
-
-    def setPutCallParityOffset(self, value):
-        self.__PutCallParityOffset = value
-    
     # Call - BS
     def callOptionPriceBlackScholes(self):
         raise NameError("Abstract Black-Scholes Call Option Price Calculator")
@@ -157,28 +312,36 @@ class Option(object):
     def putOptionPriceBachelier(self):
         raise NameError("Abstract Bachelier Put Option Price Calculator")
 
+    # Vega - BS
+    def vegaBlackScholes(self):
+        raise NameError("Abstract Black-Scholes Vega Calculator")
+
+    # Vega - Bachelier
+    def vegaBachelier(self):
+        raise NameError("Abstract Bachelier Vega Calculator")
+
     def getOptionPrice(self):
         """
         Returns a callable method to price call/put options under BS/Bac models.
         """
         
-        if self.getModelType() == "BlackScholes": 
+        if self.ModelType == "BlackScholes": 
             
-            if self.getOptionType() == "Call":
+            if self.OptionType == "Call":
                 return self.callOptionPriceBlackScholes
             
-            elif self.getOptionType() == "Put":
+            elif self.OptionType == "Put":
                 return self.putOptionPriceBlackScholes
         
             else:          
                 raise NameError("Option Type not recognized")
 
-        elif self.getModelType() == "Bachelier":
+        elif self.ModelType == "Bachelier":
 
-            if self.getOptionType() == "Call":
+            if self.OptionType == "Call":
                 return self.callOptionPriceBachelier
             
-            elif self.getOptionType() == "Put":
+            elif self.OptionType == "Put":
                 return self.putOptionPriceBachelier
 
             else:          
@@ -187,49 +350,75 @@ class Option(object):
         else:
             raise NameError("Model Type not supported")
         
-    def impliedVol(self, rootFind):
+    def getOptionVega(self):
         """
-        Returns the implied volatility. Needs in input an instance "rootFind" of the
-        RootFinder class.
+        Returns a callable method to compute the vega of call/put options under BS/Bac models.
+        
+        Comments: call and put options share the same vega, as the put-call parity offset 
+                  doesn't depend on the volatility.
+        """
+        
+        if self.ModelType == "BlackScholes": 
+            return self.vegaBlackScholes
+
+        elif self.ModelType == "Bachelier":
+            return self.vegaBachelier
+            
+        else:
+            raise NameError("Model Type not supported")
+        
+    def modelMisPrice(self, sigma):
+        """
+        Returns the distance between model and market price, as a function of the volatility.
         """
         
-        # distance between model and market
-        modelMisPrice = lambda x, self=self: self.getOptionPrice()(x) - self.V_mkt
+        return self._pricer(sigma) - self.V_mkt
         
-        return rootFind.getRootFindMethod()(modelMisPrice)
+    def impliedVol(self, rootFind, a=0, b=100):
+        """
+        Returns the implied volatility. Needs in input an instance "rootFind" of the
+        RootFinder class and, optionally, the bounds [a, b] of the root search.
+        """
+        
+        return rootFind.getRootFindMethod()(self.modelMisPrice, a, b, fprime=self._vega)
     
 def getProduct(product = "Stock", *args):
     """
     Factory method to choose the appropriate child class of Option.
     """
     
-    products = {"Stock": Stock(*args),
-                "Future": Future(*args)}
+    products = {"Stock": Stock,
+                "Future": Future}
     
-    return products[product]
+    return products[product](*args)
         
 class Stock(Option):
 
+    __slots__ = ("_discountedStrike", "_logForwardMoneyness", "_bachelierMoneyness", "_integratedVarianceFactor")
+
     def __init__(self, V_mkt, X, K, tau, r, OptionType, ModelType):
         
         super().__init__(V_mkt, X, K, tau, r, OptionType, ModelType)
         
-        self.setPutCallParityOffset(K * np.exp(-r * tau) - X)      
+        # volatility independent inputs of the pricing formulas
+        self._discountedStrike = self.K * self._discount # K_star
+        self._logForwardMoneyness = self._logXK + self.r * self.tau # log(F / K)
+        self._bachelierMoneyness = self.X - self._discountedStrike
+        with np.errstate(divide='ignore', invalid='ignore'): # undefined (NaN) for r = 0
+            self._integratedVarianceFactor = 0.5 * (1.0 - np.exp(-2.0 * self.r * self.tau)) / self.r # v_tT / sigma^2
+        
+        self.PutCallParityOffset = self._discountedStrike - self.X
     
     # Call - BS
     def callOptionPriceBlackScholes(self, sigma):
         """
         Black-Scholes European Call Option Price on Stock as a function of BS implied volatility.
 
-        Comments: this is the plain Black-Scholes formula.
+        Comments: this is the plain Black-Scholes formula, i.e. the Black formula 
+                  with discounted forward equal to the spot and log(F / K) = log(X / K) + r * tau.
         """
-            
-        d1 = (np.log(self.X / self.K) + (self.r + 0.5 * sigma**2.0) * self.tau) / (sigma * np.sqrt(self.tau))
-        d2 = d1 - sigma * np.sqrt(self.tau)
         
-        V_call = self.X * norm.cdf(d1) - np.exp(-self.r * self.tau) * self.K * norm.cdf(d2)
-        
-        return V_call
+        return blackCallPrice(self.X, self._discountedStrike, self._logForwardMoneyness, sigma * self._sqrtTau)
 
 
     # Put - BS
@@ -240,7 +429,15 @@ class Stock(Option):
         Comments: derived from the result for the call option and put-call parity.
         """
         
-        return self.callOptionPriceBlackScholes(sigma) + self.getPutCallParityOffset()
+        return self.callOptionPriceBlackScholes(sigma) + self.PutCallParityOffset
+        
+    # Vega - BS
+    def vegaBlackScholes(self, sigma):
+        """
+        Black-Scholes European Option Vega on Stock as a function of BS implied volatility.
+        """
+        
+        return blackVega(self.X, self._logForwardMoneyness, sigma * self._sqrtTau) * self._sqrtTau
         
     # Call - Bachelier
     def callOptionPriceBachelier(self, sigma):
@@ -254,14 +451,9 @@ class Stock(Option):
                   https://quant.stackexchange.com/questions/32863/bachelier-model-call-option-pricing-formula
         """
         
-        K_star = self.K * np.exp(-self.r * self.tau) # discounted strike
-        v_tT = 0.5 * (sigma**2 / self.r) * (1.0 - np.exp(-2.0 * self.r * self.tau)) # integrated volatility
+        v_tT = sigma * sigma * self._integratedVarianceFactor # integrated volatility
         
-        d = (self.X - K_star) / v_tT
-    
-        V_call = (self.X - K_star) * norm.cdf(d) + v_tT * norm.pdf(d)
-        
-        return V_call
+        return bachelierCallPrice(self._bachelierMoneyness, v_tT)
 
     # Put - Bachelier
     def putOptionPriceBachelier(self, sigma):
@@ -273,18 +465,38 @@ class Stock(Option):
         
         V_call = self.callOptionPriceBachelier(sigma)
         
-        V_put = V_call + self.getPutCallParityOffset()
+        V_put = V_call + self.PutCallParityOffset
         
         return V_put
 
+    # Vega - Bachelier
+    def vegaBachelier(self, sigma):
+        """
+        Bachelier European Option Vega on Stock as a function of normal implied volatility.
+        
+        Comments: the call price depends on sigma only through v_tT, with dV/dv_tT = pdf(d) 
+                  and dv_tT/dsigma = 2 * v_tT / sigma.
+        """
+        
+        v_tT = sigma * sigma * self._integratedVarianceFactor # integrated volatility
+        
+        return bachelierVega(self._bachelierMoneyness, v_tT) * 2.0 * sigma * self._integratedVarianceFactor
+
             
 class Future(Option):
     
+    __slots__ = ("_discountedForward", "_discountedStrike", "_bachelierMoneyness")
+
     def __init__(self, V_mkt, X, K, tau, r, OptionType, ModelType):
         
         super().__init__(V_mkt, X, K, tau, r, OptionType, ModelType)
         
-        self.setPutCallParityOffset((K - X) * np.exp(-r * tau))
+        # volatility independent inputs of the pricing formulas
+        self._discountedForward = self.X * self._discount
+        self._discountedStrike = self.K * self._discount
+        self._bachelierMoneyness = self.X - self.K
+        
+        self.PutCallParityOffset = (self.K - self.X) * self._discount
     
     # Call - BS
     def callOptionPriceBlackScholes(self, sigma):
@@ -294,12 +506,7 @@ class Future(Option):
         Comments: this is the so-called Black-76 formula.
         """
  
-        d1 = (np.log(self.X / self.K) + 0.5 * sigma**2.0 * self.tau) / (sigma * np.sqrt(self.tau))
-        d2 = d1 - sigma * np.sqrt(self.tau)
-        
-        V_call = np.exp(-self.r * self.tau) * (self.X * norm.cdf(d1) -  self.K * norm.cdf(d2))
-        
-        return V_call
+        return blackCallPrice(self._discountedForward, self._discountedStrike, self._logXK, sigma * self._sqrtTau)
     
     # Put - BS
     def putOptionPriceBlackScholes(self, sigma):
@@ -311,10 +518,18 @@ class Future(Option):
         
         V_call = self.callOptionPriceBlackScholes(sigma)
         
-        V_put = V_call + self.getPutCallParityOffset()
+        V_put = V_call + self.PutCallParityOffset
         
         return V_put
         
+    # Vega - BS
+    def vegaBlackScholes(self, sigma):
+        """
+        Black-Scholes European Option Vega on Future as a function of BS implied volatility.
+        """
+ 
+        return blackVega(self._discountedForward, self._logXK, sigma * self._sqrtTau) * self._sqrtTau
+        
     # Call - Bachelier
     def callOptionPriceBachelier(self, sigma):
         """
@@ -325,11 +540,7 @@ class Future(Option):
                   Here, it is assumed that the future price follows a normal martingale: dF = (sigma) dW (A.53a)
         """
         
-        d = (self.X - self.K) / (sigma * np.sqrt(self.tau))
-    
-        V_call = (self.X - self.K) * norm.cdf(d) + sigma * np.sqrt(self.tau) * norm.pdf(d)
-        
-        return V_call
+        return bachelierCallPrice(self._bachelierMoneyness, sigma * self._sqrtTau)
 
     # Put - Bachelier
     def putOptionPriceBachelier(self, sigma):
@@ -339,7 +550,40 @@ class Future(Option):
         Comments: derived from the result for the call option and put-call parity.
         """
         
-        return self.callOptionPriceBachelier(sigma) + self.getPutCallParityOffset()
+        return self.callOptionPriceBachelier(sigma) + self.PutCallParityOffset
+
+    # Vega - Bachelier
+    def vegaBachelier(self, sigma):
+        """
+        Bachelier European Option Vega on Future as a function of normal implied volatility.
+        """
+        
+        return bachelierVega(self._bachelierMoneyness, sigma * self._sqrtTau) * self._sqrtTau
+    
+    def impliedVol(self, rootFind, a=0, b=100):
+        """
+        Returns the implied volatility. Needs in input an instance "rootFind" of the
+        RootFinder class and, optionally, the bounds [a, b] of the root search.
+        
+        Comments: at-the-money, the Bachelier price sigma * sqrt(tau / (2 pi)) is inverted in closed form.
+                  These options are pinned to a degenerate bracket [sigma, sigma], so that the root
+                  finder doesn't iterate on them.
+        """
+        
+        if self.ModelType == "Bachelier":
+            
+            atTheMoney = (self.X == self.K) & (self.V_mkt > 0)
+            
+            with np.errstate(divide='ignore', invalid='ignore'):
+                atmVol = self.V_mkt / (self._sqrtTau * INV_SQRT_2PI)
+            
+            impliedVol = super().impliedVol(rootFind, 
+                                            np.where(atTheMoney, atmVol, a), 
+                                            np.where(atTheMoney, atmVol, b))
+            
+            return np.where(atTheMoney, atmVol, impliedVol)[()]
+            
+        return super().impliedVol(rootFind, a, b)
 
 if __name__ == "__main__":
     
@@ -347,28 +591,31 @@ if __name__ == "__main__":
     
     df = pd.read_csv("./input.csv")
     
-    df["Implied Volatility"] = np.nan
-    
     rootFind = RootFinder()
-    rootFind.setRootFindMethod() # by default the root finder will be Dekker's method
+    rootFind.setRootFindMethod("newton") # Newton's method, using the analytic vega
     
-    for rowNum, row in df.iterrows():
-        
-        underlyingType = df.loc[rowNum]["Underlying Type"]
-        V_mkt          = df.loc[rowNum]["Market Price"]
-        X              = df.loc[rowNum]["Underlying"]
-        K              = df.loc[rowNum]["Strike"]
-        tau            = df.loc[rowNum]["Days To Expiry"]
-        r              = df.loc[rowNum]["Risk-Free Rate"]
-        OptionType     = df.loc[rowNum]["Option Type"]
-        ModelType      = df.loc[rowNum]["Model Type"]
-        
-        productSpecificOption = getProduct(underlyingType, V_mkt, X, K, tau, r, 
-                                           OptionType, ModelType)
+    # input columns as numpy arrays, extracted once
+    V_mkt = df["Market Price"].to_numpy()
+    X     = df["Underlying"].to_numpy()
+    K     = df["Strike"].to_numpy()
+    tau   = df["Days To Expiry"].to_numpy()
+    r     = df["Risk-Free Rate"].to_numpy()
+    
+    # output buffer (rows that don't belong to any group are left NaN)
+    impliedVol = np.full(len(df), np.nan)
+    
+    # implied volatilities of all the options of a (Underlying Type, Option Type, Model Type) 
+    # group are solved at once, as arrays
+    groups = df.groupby(["Underlying Type", "Option Type", "Model Type"]).indices
+    
+    for (underlyingType, OptionType, ModelType), rows in groups.items():
         
-        calculatedImpliedVol = productSpecificOption.impliedVol(rootFind)
+        productSpecificOption = getProduct(underlyingType, V_mkt[rows], X[rows], K[rows], 
+                                           tau[rows], r[rows], OptionType, ModelType)
         
-        df.at[rowNum, "Implied Volatility"] = calculatedImpliedVol
+        impliedVol[rows] = productSpecificOption.impliedVol(rootFind)
+    
+    df["Implied Volatility"] = impliedVol
     
     df["Years To Expiry"] = df["Days To Expiry"]/365.0
     